@@ -1490,6 +1490,22 @@ class Client:
             id=user_id
         )
 
+    def get_user(self, user_id: int) -> User | None:
+        """
+        Get a user object from the cache of recently fetched users.
+
+        Parameters
+        ----------
+        user_id: `int`
+            The ID of the user to get.
+
+        Returns
+        -------
+        `User | None`
+            The user object with the specified ID, or `None` if not found.
+        """
+        return self.state.get_cached_user(user_id)
+
     async def fetch_user(
         self,
         user_id: int
@@ -26,7 +26,7 @@ from ..message import Message, PartialMessage
 from ..role import Role, PartialRole
 from ..soundboard import PartialSoundboardSound, SoundboardSound
 from ..sticker import Sticker
-from ..user import User, PartialUser
+from ..user import User, PartialUser, UserClient
 from ..voice import VoiceState, PartialVoiceState
 from ..integrations import Integration, PartialIntegration
 
@@ -245,6 +245,13 @@ class Parser:
             guild_id=guild_id
         )
 
+    def user_update(self, data: dict) -> tuple[UserClient]:
+        # USER_UPDATE is only sent for the bot's own account
+        user = UserClient(state=self.bot.state, data=data)
+        self.bot._user_object = user
+        self.bot.state.cache_user(user)
+        return (user,)
+
     def _guild(self, data: dict) -> Guild:
         return Guild(
             state=self.bot.state,
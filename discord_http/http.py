@@ -6,12 +6,12 @@ import random
 import sys
 
 from aiohttp.client_exceptions import ContentTypeError
-from collections import deque
+from collections import deque, OrderedDict
 from multidict import CIMultiDictProxy
 from typing import Any, Self, overload, Literal, TypeVar, Generic, TYPE_CHECKING
 from urllib.parse import quote as url_quote
 
-from . import __version__
+from . import __version__, utils
 from .flags import ApplicationFlags
 from .errors import (
     NotFound, DiscordServerError,
@@ -23,7 +23,7 @@ from .gateway.flags import Intents
 
 if TYPE_CHECKING:
     from .client import Client
-    from .user import UserClient
+    from .user import User, UserClient
 
 MethodTypes = Literal["GET", "POST", "DELETE", "PUT", "HEAD", "PATCH", "OPTIONS"]
 ResMethodTypes = Literal["text", "read", "json"]
@@ -36,6 +36,21 @@ __all__ = (
     "HTTPResponse",
 )
 
+_HTTP_400_ERROR_TABLE: dict[int, type[HTTPException]] = {
+    200000: AutomodBlock,
+    200001: AutomodBlock,
+}
+
+
+def _try_json(data: str) -> dict | str:
+    _response = data
+    if isinstance(data, str):
+        try:
+            _response = utils.from_json(data)
+        except json.JSONDecodeError:
+            pass
+    return _response
+
 
 class HTTPSession(aiohttp.ClientSession):
     async def __aexit__(self):
@@ -80,7 +95,11 @@ class HTTPClient:
             await self.session.close()
 
         self.session = HTTPSession(
-            connector=aiohttp.TCPConnector(limit=0),
+            connector=aiohttp.TCPConnector(
+                limit=0,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            ),
             timeout=aiohttp.ClientTimeout(total=60),
             cookie_jar=aiohttp.DummyCookieJar()
         )
@@ -164,11 +183,14 @@ class HTTPClient:
 
         async with self.session.request(method.upper(), str(url), **kwargs) as res:
             try:
-                r = await getattr(res, res_method.lower())()
+                if res_method.lower() == "json":
+                    r = await res.json(loads=utils.from_json)
+                else:
+                    r = await getattr(res, res_method.lower())()
             except ContentTypeError:
                 if res_method == "json":
                     try:
-                        r = json.loads(await res.text())
+                        r = utils.from_json(await res.text())
                     except json.JSONDecodeError:
                         # Give up trying, something is really wrong...
                         r = await res.text()
@@ -310,6 +332,8 @@ class DiscordAPI:
         self.http: HTTPClient = HTTPClient()
 
         self._buckets: dict[str, Ratelimit] = {}
+        self._user_cache: OrderedDict[int, "User"] = OrderedDict()
+        self._scheduled_queries: set[asyncio.Task] = set()
         self._headers: str = "discord.http/{0} Python/{1} aiohttp/{2}".format(
             __version__,
             ".".join(str(i) for i in sys.version_info[:3]),
@@ -335,10 +359,100 @@ class DiscordAPI:
 
         return value
 
+    def get_cached_user(self, user_id: int) -> "User | None":
+        """
+        Get a user from the fetched users cache
+
+        Parameters
+        ----------
+        user_id: `int`
+            The ID of the user to get
+
+        Returns
+        -------
+        `User | None`
+            The cached user, if any
+        """
+        user = self._user_cache.get(user_id, None)
+        if user is not None:
+            self._user_cache.move_to_end(user_id)
+        return user
+
+    def cache_user(self, user: "User") -> None:
+        """
+        Add or replace a user in the fetched users cache
+        The least recently used user is dropped once it holds over 10,000 users
+
+        Parameters
+        ----------
+        user: `User`
+            The user to cache
+        """
+        self._user_cache[user.id] = user
+        self._user_cache.move_to_end(user.id)
+
+        if len(self._user_cache) > 10_000:
+            self._user_cache.popitem(last=False)
+
     def create_jitter(self) -> float:
         """ `float`: Simply returns a random float between 0 and 1 """
         return random.random()
 
+    async def _retry_sleep(self, tries: int) -> None:
+        await asyncio.sleep(1 + (tries * 2) + self.create_jitter())
+
+    def schedule_query(
+        self,
+        delay: float,
+        method: MethodTypes,
+        path: str,
+        **kwargs
+    ) -> asyncio.TimerHandle:
+        """
+        Make a request to the Discord API after a delay, without waiting for it.
+        Only a timer is kept until the delay is over, and HTTP errors are ignored.
+
+        Parameters
+        ----------
+        delay: `float`
+            How many seconds to wait before making the request
+        method: `str`
+            Which HTTP method to use
+        path: `str`
+            The path to make the request to
+        kwargs: `Any`
+            Any other arguments passed to `DiscordAPI.query`
+
+        Returns
+        -------
+        `asyncio.TimerHandle`
+            The timer, which can be cancelled before the request is made
+        """
+        return asyncio.get_running_loop().call_later(
+            delay, self._start_scheduled_query, method, path, kwargs
+        )
+
+    def _start_scheduled_query(
+        self,
+        method: MethodTypes,
+        path: str,
+        kwargs: dict[str, Any]
+    ) -> None:
+        task = asyncio.create_task(self._scheduled_query(method, path, kwargs))
+        self._scheduled_queries.add(task)
+        task.add_done_callback(self._scheduled_queries.discard)
+
+    async def _scheduled_query(
+        self,
+        method: MethodTypes,
+        path: str,
+        kwargs: dict[str, Any]
+    ) -> None:
+        try:
+            await self.query(method, path, **kwargs)
+        except HTTPException:
+            pass
+
     @overload
     async def query(
         self,
@@ -424,6 +538,11 @@ class DiscordAPI:
         if "Authorization" not in kwargs["headers"]:
             kwargs["headers"]["Authorization"] = f"Bot {self.token}"
 
+        if kwargs.get("json", None) is not None:
+            # Encode once here instead of letting aiohttp do it with stdlib json
+            kwargs["data"] = utils.to_json(kwargs.pop("json"))
+            kwargs["headers"].setdefault("Content-Type", "application/json")
+
         if res_method == "json" and "Content-Type" not in kwargs["headers"]:
             kwargs["headers"]["Content-Type"] = "application/json"
 
@@ -441,23 +560,6 @@ class DiscordAPI:
 
         ratelimit = self.get_ratelimit(f"{method} {path}")
 
-        _http_400_error_table: dict[int, type[HTTPException]] = {
-            200000: AutomodBlock,
-            200001: AutomodBlock,
-        }
-
-        async def _sleep(tries: int) -> None:
-            await asyncio.sleep(1 + (tries * 2) + self.create_jitter())
-
-        def _try_json(data: str) -> dict | str:
-            _response = data
-            if isinstance(data, str):
-                try:
-                    _response = json.loads(data)
-                except json.JSONDecodeError:
-                    pass
-            return _response
-
         async with ratelimit:
             for tries in range(5):
                 try:
@@ -482,7 +584,7 @@ class DiscordAPI:
                                 raise DiscordServerError(r)
 
                             # Try again, maybe it will work next time, surely...
-                            await _sleep(tries)
+                            await self._retry_sleep(tries)
                             continue
 
                         case 429:
@@ -502,15 +604,15 @@ class DiscordAPI:
                                 raise DiscordServerError(r)
 
                             # Try again, maybe it will work next time, surely...
-                            await _sleep(tries)
+                            await self._retry_sleep(tries)
                             continue
 
                         case 400:
                             _response = _try_json(r.response)
                             if isinstance(_response, str):
-                                raise _http_400_error_table.get(400, HTTPException)(r)
+                                raise _HTTP_400_ERROR_TABLE.get(400, HTTPException)(r)
                             else:
-                                raise _http_400_error_table.get(
+                                raise _HTTP_400_ERROR_TABLE.get(
                                     _response.get("code", 0),
                                     HTTPException
                                 )(r)
@@ -526,7 +628,7 @@ class DiscordAPI:
 
                 except OSError as e:
                     if tries < 4 and e.errno in (54, 10054):
-                        await _sleep(tries)
+                        await self._retry_sleep(tries)
                         continue
                     raise
             else:
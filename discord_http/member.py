@@ -89,7 +89,7 @@ class PartialMember(PartialBase):
         self,
         content: Optional[str] = MISSING,
         *,
-        channel_id: Optional[int] = MISSING,
+        channel_id: Optional[int] = None,
         embed: Optional[Embed] = MISSING,
         embeds: Optional[list[Embed]] = MISSING,
         file: Optional[File] = MISSING,
@@ -378,7 +378,7 @@ class Member(PartialMember):
         self.communication_disabled_until: datetime | None = None
         self.premium_since: datetime | None = None
         self._roles: list[PartialRole] = [
-            PartialRole(state=state, id=int(r), guild_id=self.guild.id)
+            PartialRole(state=state, id=int(r), guild_id=self.guild_id)
             for r in data["roles"]
         ]
 
@@ -397,7 +397,7 @@ class Member(PartialMember):
         has_avatar = data.get("avatar", None)
         if has_avatar:
             self.avatar = Asset._from_guild_avatar(
-                self._state, self.guild.id, self.id, has_avatar
+                self._state, self.guild_id, self.id, has_avatar
             )
 
         if data.get("communication_disabled_until", None):
@@ -1,5 +1,3 @@
-import asyncio
-
 from datetime import timedelta, datetime
 from io import BytesIO
 from typing import TYPE_CHECKING, Optional, Union, AsyncIterator, Self, Callable
@@ -770,25 +768,22 @@ class PartialMessage(PartialBase):
             Reason for deleting the message
             (Only applies when deleting messages not made by yourself)
         """
-        async def _delete():
-            await self._state.query(
+        if delay is not None:
+            self._state.schedule_query(
+                delay,
                 "DELETE",
                 f"/channels/{self.channel.id}/messages/{self.id}",
                 reason=reason,
                 res_method="text"
             )
+            return None
 
-        async def _delete_after(d: float):
-            await asyncio.sleep(d)
-            try:
-                await _delete()
-            except HTTPException:
-                pass
-
-        if delay is not None:
-            asyncio.create_task(_delete_after(delay))
-        else:
-            await _delete()
+        await self._state.query(
+            "DELETE",
+            f"/channels/{self.channel.id}/messages/{self.id}",
+            reason=reason,
+            res_method="text"
+        )
 
     async def expire_poll(self) -> "Message":
         """
@@ -1232,7 +1227,11 @@ class Message(PartialMessage):
 
         self.type: MessageType = MessageType(data["type"])
         self.content: str = data.get("content", "")
-        self.author: Union[User, "Member"] = User(state=state, data=data["author"])
+
+        if not data.get("member", None):
+            # Otherwise _from_data builds the author as a Member, which holds its own User
+            self.author: Union[User, "Member"] = User(state=state, data=data["author"])
+
         self.pinned: bool = data.get("pinned", False)
         self.mention_everyone: bool = data.get("mention_everyone", False)
         self.tts: bool = data.get("tts", False)
@@ -1501,22 +1500,19 @@ class WebhookMessage(Message):
         reason: `Optional[str]`
             Reason for deleting the message
         """
-        async def _delete():
-            await self._state.query(
+        if delay is not None:
+            self._state.schedule_query(
+                delay,
                 "DELETE",
                 f"/webhooks/{self.application_id}/{self.token}/messages/{self.id}",
                 webhook=True,
                 res_method="text"
             )
+            return None
 
-        async def _delete_after(d: float):
-            await asyncio.sleep(d)
-            try:
-                await _delete()
-            except HTTPException:
-                pass
-
-        if delay is not None:
-            asyncio.create_task(_delete_after(delay))
-        else:
-            await _delete()
+        await self._state.query(
+            "DELETE",
+            f"/webhooks/{self.application_id}/{self.token}/messages/{self.id}",
+            webhook=True,
+            res_method="text"
+        )
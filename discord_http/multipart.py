@@ -1,7 +1,6 @@
-import json
-
 from io import BufferedIOBase
 
+from . import utils
 from .file import File
 
 __all__ = (
@@ -59,7 +58,7 @@ class MultipartData:
 
             case x if isinstance(x, dict):
                 string += "\r\nContent-Type: application/json\r\n\r\n"
-                data = json.dumps(data)
+                data = utils.to_json(data)  # type: ignore
 
             case _:
                 string += "\r\n\r\n"
@@ -12,14 +12,17 @@ class Snowflake:
     """
     A class to represent a Discord Snowflake
     """
+    __slots__ = ("id",)
+
     def __init__(
         self,
         id: int | str
     ):
-        try:
-            id = int(id)
-        except ValueError:
-            raise TypeError(f"id must be an integer or convertible to integer, not {type(id)}")
+        if type(id) is not int:
+            try:
+                id = int(id)
+            except ValueError:
+                raise TypeError(f"id must be an integer or convertible to integer, not {type(id)}")
 
         self.id: int = id
 
@@ -107,8 +110,10 @@ class PartialBase(Snowflake):
     This class is based on the Snowflae class standard,
     but with a few extra attributes.
     """
+    __slots__ = ()
+
     def __init__(self, *, id: int):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
 
     def __repr__(self) -> str:
         return f"<PartialBase id={self.id}>"
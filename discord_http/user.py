@@ -1,3 +1,5 @@
+import sys
+
 from typing import TYPE_CHECKING, Optional, Union, Any
 
 from . import utils
@@ -19,6 +21,8 @@ if TYPE_CHECKING:
 
 MISSING = utils.MISSING
 
+_DEFAULT_AVATAR_MOD = len(DefaultAvatarType)
+
 __all__ = (
     "UserClient",
     "PartialUser",
@@ -27,28 +31,36 @@ __all__ = (
 
 
 class PartialUser(PartialBase):
+    __slots__ = ("_state", "_mention", "_repr")
+
     def __init__(
         self,
         *,
         state: "DiscordAPI",
         id: int
     ):
-        super().__init__(id=int(id))
+        super().__init__(id=id)
         self._state = state
+        self._mention: Optional[str] = None
+        self._repr: Optional[str] = None
 
     def __repr__(self) -> str:
-        return f"<PartialUser id={self.id}>"
+        if self._repr is None:
+            self._repr = f"<PartialUser id={self.id}>"
+        return self._repr
 
     @property
     def mention(self) -> str:
         """ `str`: Returns a string that allows you to mention the user """
-        return f"<@!{self.id}>"
+        if self._mention is None:
+            self._mention = f"<@!{self.id}>"
+        return self._mention
 
     async def send(
         self,
         content: Optional[str] = MISSING,
         *,
-        channel_id: Optional[int] = MISSING,
+        channel_id: Optional[int] = None,
         embed: Optional[Embed] = MISSING,
         embeds: Optional[list[Embed]] = MISSING,
         file: Optional[File] = MISSING,
@@ -95,7 +107,7 @@ class PartialUser(PartialBase):
         `Message`
             The message that was sent
         """
-        if channel_id is MISSING:
+        if channel_id is None:
             fetch_channel = await self.create_dm()
             channel_id = fetch_channel.id
 
@@ -119,8 +131,7 @@ class PartialUser(PartialBase):
             headers={"Content-Type": payload.content_type}
         )
 
-        from .message import Message
-        _msg = Message(
+        _msg = _message.Message(
             state=self._state,
             data=r.response
         )
@@ -137,8 +148,7 @@ class PartialUser(PartialBase):
             json={"recipient_id": self.id}
         )
 
-        from .channel import DMChannel
-        return DMChannel(
+        return _channel.DMChannel(
             state=self._state,
             data=r.response
         )
@@ -150,90 +160,145 @@ class PartialUser(PartialBase):
             f"/users/{self.id}"
         )
 
-        return User(
+        user = User(
             state=self._state,
             data=r.response
         )
 
+        self._state.cache_user(user)
+        return user
+
     @property
     def default_avatar(self) -> Asset:
         """ `Asset`: Returns the default avatar of the user """
         return Asset._from_default_avatar(
             self._state,
-            (self.id >> 22) % len(DefaultAvatarType)
+            (self.id >> 22) % _DEFAULT_AVATAR_MOD
         )
 
 
 class User(PartialUser):
+    __slots__ = (
+        "name",
+        "bot",
+        "system",
+        "_discriminator",
+        "global_name",
+        "clan",
+        "_avatar",
+        "_banner",
+        "_avatar_decoration",
+        "_public_flags",
+        "_accent_colour",
+        "_banner_colour",
+        "_str",
+    )
+
     def __init__(
         self,
         *,
         state: "DiscordAPI",
         data: dict
     ):
-        super().__init__(state=state, id=int(data["id"]))
-
-        self.avatar: Optional[Asset] = None
-        self.banner: Optional[Asset] = None
+        super().__init__(state=state, id=data["id"])
 
-        self.name: str = data["username"]
+        # Usernames repeat a lot across payloads, so share one string per name
+        self.name: str = sys.intern(data["username"])
         self.bot: bool = data.get("bot", False)
         self.system: bool = data.get("system", False)
 
         # This section is ONLY here because bots still have a discriminator
-        self.discriminator: Optional[str] = data.get("discriminator", None)
-        if self.discriminator == "0":
-            # Instead of showing "0", just make it None....
-            self.discriminator = None
-
-        self.accent_colour: Optional[Colour] = None
-        self.banner_colour: Optional[Colour] = None
+        # Stored as an int, where -1 means the user has none ("0" from Discord)
+        # "0000" is a real discriminator, used by webhook message authors
+        _discriminator = data.get("discriminator", None)
+        self._discriminator: int = (
+            -1 if _discriminator in (None, "", "0")
+            else int(_discriminator)
+        )
 
-        self.avatar_decoration: Optional[Asset] = None
         self.global_name: Optional[str] = data.get("global_name", None)
-
-        self.public_flags: UserFlags | None = None
+        if self.global_name is not None:
+            self.global_name = sys.intern(self.global_name)
 
         # This might change a lot
         self.clan: Optional[dict] = data.get("clan", None)
 
+        self._str: Optional[str] = None
         self._from_data(data)
 
     def __repr__(self) -> str:
-        return (
-            f"<User id={self.id} name='{self.name}' "
-            f"global_name='{self.global_name}'>"
-        )
+        if self._repr is None:
+            self._repr = (
+                f"<User id={self.id} name='{self.name}' "
+                f"global_name='{self.global_name}'>"
+            )
+        return self._repr
 
     def __str__(self) -> str:
-        if self.discriminator:
-            return f"{self.name}#{self.discriminator}"
-        return self.name
+        if self._str is None:
+            self._str = (
+                f"{self.name}#{self.discriminator}"
+                if self._discriminator >= 0 else self.name
+            )
+        return self._str
 
     def _from_data(self, data: dict):
-        if data.get("avatar", None):
-            self.avatar = Asset._from_avatar(
-                self._state, self.id, data["avatar"]
-            )
+        # Assets, flags and colours are only built when they are accessed
+        self._avatar: Optional[str] = data.get("avatar", None)
+        self._banner: Optional[str] = data.get("banner", None)
+        self._avatar_decoration: Optional[str] = data.get("avatar_decoration", None)
+        self._public_flags: Optional[int] = data.get("public_flags", None)
+        self._accent_colour: Optional[int] = data.get("accent_color", None)
+        self._banner_colour: Optional[str] = data.get("banner_color", None)
 
-        if data.get("banner", None):
-            self.banner = Asset._from_banner(
-                self._state, self.id, data["banner"]
-            )
+    @property
+    def avatar(self) -> Optional[Asset]:
+        """ `Optional[Asset]`: Returns the avatar of the user """
+        if not self._avatar:
+            return None
+        return Asset._from_avatar(self._state, self.id, self._avatar)
 
-        if data.get("accent_color", None):
-            self.accent_colour = Colour(data["accent_color"])
+    @property
+    def banner(self) -> Optional[Asset]:
+        """ `Optional[Asset]`: Returns the banner of the user """
+        if not self._banner:
+            return None
+        return Asset._from_banner(self._state, self.id, self._banner)
 
-        if data.get("banner_color", None):
-            self.banner_colour = Colour.from_hex(data["banner_color"])
+    @property
+    def avatar_decoration(self) -> Optional[Asset]:
+        """ `Optional[Asset]`: Returns the avatar decoration of the user """
+        if not self._avatar_decoration:
+            return None
+        return Asset._from_avatar_decoration(self._state, self._avatar_decoration)
 
-        if data.get("avatar_decoration", None):
-            self.avatar_decoration = Asset._from_avatar_decoration(
-                self._state, data["avatar_decoration"]
-            )
+    @property
+    def public_flags(self) -> Optional[UserFlags]:
+        """ `Optional[UserFlags]`: Returns the public flags of the user """
+        if not self._public_flags:
+            return None
+        return UserFlags(self._public_flags)
+
+    @property
+    def discriminator(self) -> Optional[str]:
+        """ `Optional[str]`: Returns the discriminator of the user, if any """
+        if self._discriminator < 0:
+            return None
+        return f"{self._discriminator:04d}"
 
-        if data.get("public_flags", None):
-            self.public_flags = UserFlags(data["public_flags"])
+    @property
+    def accent_colour(self) -> Optional[Colour]:
+        """ `Optional[Colour]`: Returns the accent colour of the user """
+        if not self._accent_colour:
+            return None
+        return Colour(self._accent_colour)
+
+    @property
+    def banner_colour(self) -> Optional[Colour]:
+        """ `Optional[Colour]`: Returns the banner colour of the user """
+        if not self._banner_colour:
+            return None
+        return Colour.from_hex(self._banner_colour)
 
     @property
     def global_avatar(self) -> Optional[Asset]:
@@ -252,6 +317,8 @@ class User(PartialUser):
 
 
 class UserClient(User):
+    __slots__ = ("verified",)
+
     def __init__(
         self,
         *,
@@ -263,7 +330,9 @@ class UserClient(User):
         self.verified: bool = data.get("verified", False)
 
     def __repr__(self) -> str:
-        return f"<UserClient id={self.id} name='{self.name}'>"
+        if self._repr is None:
+            self._repr = f"<UserClient id={self.id} name='{self.name}'>"
+        return self._repr
 
     async def edit(
         self,
@@ -295,7 +364,15 @@ class UserClient(User):
             json=payload
         )
 
-        return UserClient(
+        user = UserClient(
             state=self._state,
             data=r.response
         )
+
+        self._state.cache_user(user)
+        return user
+
+
+# Both modules import this one, so they can only be bound once the classes above exist
+from . import channel as _channel  # noqa: E402
+from . import message as _message  # noqa: E402
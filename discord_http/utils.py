@@ -1,15 +1,27 @@
+import json
 import logging
 import re
 import sys
 import traceback
 import unicodedata
 
-from base64 import b64encode
 from datetime import datetime, timedelta, UTC
 from typing import Any, Iterator, TYPE_CHECKING
 
 from .file import File
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+try:
+    from pybase64 import b64encode
+except ModuleNotFoundError:
+    from base64 import b64encode
+
 if TYPE_CHECKING:
     from .object import Snowflake
 
@@ -448,6 +460,49 @@ def bytes_to_base64(image: File | bytes) -> str:
     )
 
 
+def from_json(data: str | bytes) -> Any:
+    """
+    Decode JSON data, using `orjson` if it is installed
+
+    Parameters
+    ----------
+    data: `str | bytes`
+        The JSON data to decode
+
+    Returns
+    -------
+    `Any`
+        The decoded JSON data
+
+    Raises
+    ------
+    `json.JSONDecodeError`
+        The data provided is not valid JSON
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def to_json(data: Any) -> bytes:
+    """
+    Encode data to JSON bytes, using `orjson` if it is installed
+
+    Parameters
+    ----------
+    data: `Any`
+        The data to encode
+
+    Returns
+    -------
+    `bytes`
+        The encoded JSON data
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
 def get_int(
     data: dict,
     key: str,